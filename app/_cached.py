@@ -0,0 +1,234 @@
+import numpy as np
+import streamlit as st
+
+from budgetools.budget import BaseBudget
+from budgetools.forecast import NetWorthSimulation, SalaryExpensesForecasting
+
+
+@st.cache_data(ttl=3600)
+def cached_budget_breakdown(
+    salary: int,
+    tax_rate: float,
+    rent: int,
+    food_daily: int,
+    entertainment: int,
+    emergency_expenses: int,
+):
+    """
+    Cached wrapper around `BaseBudget` for the monthly budget page, keyed on
+    the scalar inputs.
+
+    Returns
+    -------
+    tuple
+        The (monthly salary after tax, monthly expenses, monthly savings)
+        values for the given inputs.
+    """
+    base = BaseBudget(salary=salary, tax_rate=tax_rate)
+    base.rent = rent
+    base.food_daily = food_daily
+    base.entertainment = entertainment
+    base.emergency_expenses = emergency_expenses
+
+    salary_after_tax = base.monthly_salary_after_tax()
+    expenses = base.monthly_expenses()
+
+    return (
+        salary_after_tax,
+        expenses,
+        base.monthly_savings(salary_after_tax, expenses),
+    )
+
+
+@st.cache_data(ttl=3600)
+def cached_living_forecast(
+    years: int,
+    salary: int,
+    tax_rate: float,
+    salary_growth: float,
+    rent: int,
+    food_daily: int,
+    entertainment: int,
+    emergency_expenses: int,
+    annual_inflation: float,
+):
+    """
+    Cached wrapper around `SalaryExpensesForecasting` so reruns of the
+    forecast pages with unchanged inputs hit an in-memory lookup instead of
+    recomputing the monthly forecast arrays.
+
+    Returns
+    -------
+    tuple
+        The (salary forecast, expenses forecast) arrays for the given inputs.
+    """
+    forecast_living = SalaryExpensesForecasting(
+        years=years, salary=salary, tax_rate=tax_rate
+    )
+    forecast_living.annual_salary_growth = salary_growth
+    forecast_living.rent = rent
+    forecast_living.food_daily = food_daily
+    forecast_living.entertainment = entertainment
+    forecast_living.emergency_expenses = emergency_expenses
+    forecast_living.annual_inflation = annual_inflation
+
+    return (
+        forecast_living.monthly_salary_forecast().astype(np.float32),
+        forecast_living.monthly_expenses_forecast().astype(np.float32),
+    )
+
+
+def _net_worth_simulation(
+    years: int,
+    salary: int,
+    tax_rate: float,
+    monthly_investment_pct: float,
+    rent: int,
+    food_daily: int,
+    entertainment: int,
+    emergency_expenses: int,
+    annual_inflation: float,
+    salary_growth: float,
+) -> NetWorthSimulation:
+    """
+    Builds a `NetWorthSimulation` with the given scalar inputs assigned, shared
+    by the cached wrappers below.
+    """
+    simulation = NetWorthSimulation(
+        years=years,
+        salary=salary,
+        tax_rate=tax_rate,
+        monthly_investment_pct=monthly_investment_pct,
+    )
+    simulation.rent = rent
+    simulation.food_daily = food_daily
+    simulation.entertainment = entertainment
+    simulation.emergency_expenses = emergency_expenses
+    simulation.annual_inflation = annual_inflation
+    simulation.annual_salary_growth = salary_growth
+
+    return simulation
+
+
+@st.cache_data(ttl=3600)
+def cached_savings_forecast(
+    years: int,
+    salary: int,
+    tax_rate: float,
+    rent: int,
+    food_daily: int,
+    entertainment: int,
+    emergency_expenses: int,
+    annual_inflation: float,
+    salary_growth: float,
+):
+    """
+    Cached wrapper around `NetWorthSimulation.savings_forecast` keyed on the
+    scalar inputs.
+
+    Returns
+    -------
+    tuple
+        The (final net worth, cumulative savings) pair for the given inputs.
+    """
+    forecast_savings = _net_worth_simulation(
+        years=years,
+        salary=salary,
+        tax_rate=tax_rate,
+        monthly_investment_pct=0,
+        rent=rent,
+        food_daily=food_daily,
+        entertainment=entertainment,
+        emergency_expenses=emergency_expenses,
+        annual_inflation=annual_inflation,
+        salary_growth=salary_growth,
+    )
+
+    final_net_worth, cumulative_savings = forecast_savings.savings_forecast()
+
+    return final_net_worth, cumulative_savings.astype(np.float32)
+
+
+@st.cache_data(ttl=3600)
+def cached_monthly_income_investment(
+    years: int,
+    salary: int,
+    tax_rate: float,
+    investment_pct: float,
+    rent: int,
+    food_daily: int,
+    entertainment: int,
+    emergency_expenses: int,
+    annual_inflation: float,
+    salary_growth: float,
+):
+    """
+    Cached wrapper around `NetWorthSimulation.monthly_income_investment` keyed
+    on the scalar inputs.
+
+    Returns
+    -------
+    tuple
+        The (investment deposit forecast, savings forecast post investment,
+        cumulative savings) arrays for the given inputs.
+    """
+    forecast_investment_savings = _net_worth_simulation(
+        years=years,
+        salary=salary,
+        tax_rate=tax_rate,
+        monthly_investment_pct=investment_pct,
+        rent=rent,
+        food_daily=food_daily,
+        entertainment=entertainment,
+        emergency_expenses=emergency_expenses,
+        annual_inflation=annual_inflation,
+        salary_growth=salary_growth,
+    )
+
+    return tuple(
+        series.astype(np.float32)
+        for series in forecast_investment_savings.monthly_income_investment()
+    )
+
+
+@st.cache_data(ttl=3600)
+def cached_net_worth_savings_investments(
+    years: int,
+    salary: int,
+    tax_rate: float,
+    investment_pct: float,
+    rent: int,
+    food_daily: int,
+    entertainment: int,
+    emergency_expenses: int,
+    annual_inflation: float,
+    salary_growth: float,
+    investment_return: float,
+):
+    """
+    Cached wrapper around `NetWorthSimulation.full_simulation` keyed on the
+    scalar inputs.
+
+    Returns
+    -------
+    tuple
+        The (cumulative savings, investment portfolio, net worth) arrays for
+        the given inputs.
+    """
+    forecast_net_worth = _net_worth_simulation(
+        years=years,
+        salary=salary,
+        tax_rate=tax_rate,
+        monthly_investment_pct=investment_pct,
+        rent=rent,
+        food_daily=food_daily,
+        entertainment=entertainment,
+        emergency_expenses=emergency_expenses,
+        annual_inflation=annual_inflation,
+        salary_growth=salary_growth,
+    )
+    forecast_net_worth.annual_investment_return = investment_return
+
+    return tuple(
+        series.astype(np.float32) for series in forecast_net_worth.full_simulation()
+    )
@@ -1,6 +1,6 @@
 import streamlit as st
 
-from budgetools.budget import BaseBudget
+from _cached import cached_budget_breakdown
 
 # Title to app
 st.title("Calculator for a basic monthly budget 📝")
@@ -35,23 +35,26 @@ emergency_expenses = st.number_input(
 
 if st.button("Calculate your monthly disposable income and savings"):
 
-    base = BaseBudget(salary=salary, tax_rate=tax_rate)
-    base.rent = rent
-    base.food_daily = food_daily
-    base.entertainment = entertainment
-    base.emergency_expenses = emergency_expenses
+    salary_after_tax, expenses, savings = cached_budget_breakdown(
+        salary=salary,
+        tax_rate=tax_rate,
+        rent=rent,
+        food_daily=food_daily,
+        entertainment=entertainment,
+        emergency_expenses=emergency_expenses,
+    )
 
     st.markdown(
         f"""**Monthly salary after tax is:** \n\n
-        {base.monthly_salary_after_tax():.0f}"""
+        {salary_after_tax:.0f}"""
     )
 
     st.markdown(
         f"""**Monthly expenses is:** \n\n
-        {base.monthly_expenses():.0f}"""
+        {expenses:.0f}"""
     )
 
     st.markdown(
         f"""**Monthly savings is:** \n\n
-        {base.monthly_savings():.0f}"""
+        {savings:.0f}"""
     )
@@ -2,7 +2,7 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
-from budgetools.forecast import SalaryExpensesForecasting
+from _cached import cached_living_forecast
 
 # Title to app
 st.title("Calculator for forecasting income and expenses growth over time 🔮")
@@ -58,34 +58,34 @@ annual_inflation = st.number_input(
 )
 
 if st.button("Calculate your forecasted income and expenses"):
-    forecast_living = SalaryExpensesForecasting(
-        years=years, salary=salary, tax_rate=tax_rate
-    )
-    forecast_living.annual_salary_growth = salary_growth
     # Take the years and convert to months as a forecast parameter
     forecast_months = 12 * years
-    salary_forecast = forecast_living.monthly_salary_forecast()
-
-    forecast_living.rent = rent
-    forecast_living.food_daily = food_daily
-    forecast_living.entertainment = entertainment
-    forecast_living.emergency_expenses = emergency_expenses
-    forecast_living.annual_inflation = annual_inflation
-    expenses_forecast = forecast_living.monthly_expenses_forecast()
+    x_months = np.arange(1, forecast_months + 1)
+    salary_forecast, expenses_forecast = cached_living_forecast(
+        years=years,
+        salary=salary,
+        tax_rate=tax_rate,
+        salary_growth=salary_growth,
+        rent=rent,
+        food_daily=food_daily,
+        entertainment=entertainment,
+        emergency_expenses=emergency_expenses,
+        annual_inflation=annual_inflation,
+    )
 
     # Create traces
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
-            x=np.arange(1, forecast_months + 1, 1),
+        go.Scattergl(
+            x=x_months,
             y=salary_forecast,
             mode="lines",
             name="Salary",
         )
     )
     fig.add_trace(
-        go.Scatter(
-            x=np.arange(1, forecast_months + 1, 1),
+        go.Scattergl(
+            x=x_months,
             y=expenses_forecast,
             mode="lines",
             name="Expenses",
@@ -2,7 +2,7 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
-from budgetools.forecast import NetWorthSimulation
+from _cached import cached_savings_forecast
 
 # Title to app
 st.title("Calculator for forecasting savings accumulation over time 💰")
@@ -58,18 +58,19 @@ annual_inflation = st.number_input(
 )
 
 if st.button("Calculate your forecasted savings accumulation"):
-    forecast_savings = NetWorthSimulation(
-        years=years, salary=salary, tax_rate=tax_rate, monthly_investment_pct=0
-    )
     # Take the years and convert to months as a forecast parameter
     forecast_months = 12 * years
-    forecast_savings.rent = rent
-    forecast_savings.food_daily = food_daily
-    forecast_savings.entertainment = entertainment
-    forecast_savings.emergency_expenses = emergency_expenses
-    forecast_savings.annual_inflation = annual_inflation
-    forecast_savings.annual_salary_growth = salary_growth
-    final_net_worth, cumulative_savings = forecast_savings.savings_forecast()
+    final_net_worth, cumulative_savings = cached_savings_forecast(
+        years=years,
+        salary=salary,
+        tax_rate=tax_rate,
+        rent=rent,
+        food_daily=food_daily,
+        entertainment=entertainment,
+        emergency_expenses=emergency_expenses,
+        annual_inflation=annual_inflation,
+        salary_growth=salary_growth,
+    )
 
     st.markdown(
         f"""**Final net worth based on savings simulation:** \n\n
@@ -79,7 +80,7 @@ if st.button("Calculate your forecasted savings accumulation"):
     # Create traces
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=np.arange(1, forecast_months + 1, 1),
             y=cumulative_savings,
             mode="lines",
@@ -2,7 +2,7 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
-from budgetools.forecast import NetWorthSimulation
+from _cached import cached_monthly_income_investment
 
 # Title to app
 st.title("Calculator for forecasting investment along with saving 📈")
@@ -75,41 +75,39 @@ investment_return = st.number_input(
 )
 
 if st.button("Calculate your forecasted investment & savings schedule"):
-    forecast_investment_savings = NetWorthSimulation(
-        years=years,
-        salary=salary,
-        tax_rate=tax_rate,
-        monthly_investment_pct=investment_pct,
-    )
     # Take the years and convert to months as a forecast parameter
     forecast_months = 12 * years
-    forecast_investment_savings.rent = rent
-    forecast_investment_savings.food_daily = food_daily
-    forecast_investment_savings.entertainment = entertainment
-    forecast_investment_savings.emergency_expenses = emergency_expenses
-    forecast_investment_savings.annual_inflation = annual_inflation
-    forecast_investment_savings.annual_salary_growth = salary_growth
-    forecast_investment_savings.annual_investment_return = investment_return
-
+    x_months = np.arange(1, forecast_months + 1)
     (
         investment_deposit_forecast,
         savings_forecast_post_investment,
         cumulative_savings_new,
-    ) = forecast_investment_savings.monthly_income_investment()
+    ) = cached_monthly_income_investment(
+        years=years,
+        salary=salary,
+        tax_rate=tax_rate,
+        investment_pct=investment_pct,
+        rent=rent,
+        food_daily=food_daily,
+        entertainment=entertainment,
+        emergency_expenses=emergency_expenses,
+        annual_inflation=annual_inflation,
+        salary_growth=salary_growth,
+    )
 
     # Create traces
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
-            x=np.arange(1, forecast_months + 1, 1),
+        go.Scattergl(
+            x=x_months,
             y=investment_deposit_forecast,
             mode="lines",
             name="Investment",
         )
     )
     fig.add_trace(
-        go.Scatter(
-            x=np.arange(1, forecast_months + 1, 1),
+        go.Scattergl(
+            x=x_months,
             y=savings_forecast_post_investment,
             mode="lines",
             name="Savings",
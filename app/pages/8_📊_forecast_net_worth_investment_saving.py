@@ -2,7 +2,7 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
-from budgetools.forecast import NetWorthSimulation
+from _cached import cached_net_worth_savings_investments
 
 # Title to app
 st.title(
@@ -79,56 +79,48 @@ investment_return = st.number_input(
 )
 
 if st.button("Calculate your forecasted net worth i.e. planned savings + investments"):
-    forecast_net_worth = NetWorthSimulation(
-        years=years,
-        salary=salary,
-        tax_rate=tax_rate,
-        monthly_investment_pct=investment_pct,
-    )
     # Take the years and convert to months as a forecast parameter
     forecast_months = 12 * years
-    forecast_net_worth.rent = rent
-    forecast_net_worth.food_daily = food_daily
-    forecast_net_worth.entertainment = entertainment
-    forecast_net_worth.emergency_expenses = emergency_expenses
-    forecast_net_worth.annual_inflation = annual_inflation
-    forecast_net_worth.annual_salary_growth = salary_growth
-    forecast_net_worth.annual_investment_return = investment_return
-    final_net_worth, cumulative_savings = forecast_net_worth.savings_forecast()
-
-    (
-        investment_deposit_forecast,
-        savings_forecast_post_investment,
-        cumulative_savings_new,
-    ) = forecast_net_worth.monthly_income_investment()
-
+    x_months = np.arange(1, forecast_months + 1)
     (
         cumulated_savings_new,
         investment_portfolio,
         net_worth,
-    ) = forecast_net_worth.net_worth_savings_investments()
+    ) = cached_net_worth_savings_investments(
+        years=years,
+        salary=salary,
+        tax_rate=tax_rate,
+        investment_pct=investment_pct,
+        rent=rent,
+        food_daily=food_daily,
+        entertainment=entertainment,
+        emergency_expenses=emergency_expenses,
+        annual_inflation=annual_inflation,
+        salary_growth=salary_growth,
+        investment_return=investment_return,
+    )
 
     # Create traces
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
-            x=np.arange(1, forecast_months + 1, 1),
+        go.Scattergl(
+            x=x_months,
             y=net_worth,
             mode="lines",
             name="Net Worth",
         )
     )
     fig.add_trace(
-        go.Scatter(
-            x=np.arange(1, forecast_months + 1, 1),
+        go.Scattergl(
+            x=x_months,
             y=cumulated_savings_new,
             mode="lines",
             name="Savings",
         )
     )
     fig.add_trace(
-        go.Scatter(
-            x=np.arange(1, forecast_months + 1, 1),
+        go.Scattergl(
+            x=x_months,
             y=investment_portfolio,
             mode="lines",
             name="Investment",
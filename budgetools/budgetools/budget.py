@@ -1,3 +1,13 @@
+def _validate_non_negative(value: int, message: str) -> int:
+    """
+    Shared guard for the expense setters: returns the value unchanged or
+    raises `ValueError` with the setter-specific message when negative.
+    """
+    if value < 0:
+        raise ValueError(message)
+    return value
+
+
 class BaseBudget:
     """
     Foundational budget instance class for computing a simple
@@ -21,6 +31,15 @@ class BaseBudget:
         subtract monthly expenses (monthly_expenses).
     """
 
+    __slots__ = (
+        "salary",
+        "tax_rate",
+        "_rent",
+        "_food_daily",
+        "_entertainment",
+        "_emergency_expenses",
+    )
+
     def __init__(self, salary: int, tax_rate: float):
         """
         Instantiates the attributes for the BaseBudget object.
@@ -76,9 +95,9 @@ class BaseBudget:
 
     @rent.setter
     def rent(self, rent_value: int):
-        if rent_value < 0:
-            raise ValueError("Your rent should be 0 or above")
-        self._rent = rent_value
+        self._rent = _validate_non_negative(
+            rent_value, "Your rent should be 0 or above"
+        )
 
     @property
     def food_daily(self) -> int:
@@ -94,9 +113,9 @@ class BaseBudget:
 
     @food_daily.setter
     def food_daily(self, food_value: int):
-        if food_value < 0:
-            raise ValueError("Your food expenses should be 0 or above")
-        self._food_daily = food_value
+        self._food_daily = _validate_non_negative(
+            food_value, "Your food expenses should be 0 or above"
+        )
 
     @property
     def entertainment(self) -> int:
@@ -112,9 +131,9 @@ class BaseBudget:
 
     @entertainment.setter
     def entertainment(self, entertainment_value: int):
-        if entertainment_value < 0:
-            raise ValueError("Sorry your entertainment expenses should be 0 or above")
-        self._entertainment = entertainment_value
+        self._entertainment = _validate_non_negative(
+            entertainment_value, "Sorry your entertainment expenses should be 0 or above"
+        )
 
     @property
     def emergency_expenses(self) -> int:
@@ -132,9 +151,9 @@ class BaseBudget:
 
     @emergency_expenses.setter
     def emergency_expenses(self, emergency_value: int):
-        if emergency_value < 0:
-            raise ValueError("Sorry your emergency expenses should be 0 or above")
-        self._emergency_expenses = emergency_value
+        self._emergency_expenses = _validate_non_negative(
+            emergency_value, "Sorry your emergency expenses should be 0 or above"
+        )
 
     def monthly_expenses(self) -> int | float:
         """
@@ -170,7 +189,11 @@ class BaseBudget:
 
         return expenses_per_month
 
-    def monthly_savings(self) -> int | float:
+    def monthly_savings(
+        self,
+        salary_after_tax: int | float | None = None,
+        expenses: int | float | None = None,
+    ) -> int | float:
         """
         Computes the monthly savings by subtracting monthly_expenses from
         monthly_salary_after_tax based on properties defined beforehand:
@@ -179,6 +202,15 @@ class BaseBudget:
         - entertainment
         - emergency
 
+        Parameters
+        ----------
+        `salary_after_tax` : int | float, optional
+            A previously computed monthly_salary_after_tax value, so callers
+            that already hold it avoid recomputing it here.
+        `expenses` : int | float, optional
+            A previously computed monthly_expenses value, so callers that
+            already hold it avoid recomputing it here.
+
         Returns
         -------
         int | float
@@ -195,8 +227,11 @@ class BaseBudget:
         >>> base.monthly_savings()
         1550
         """
-        monthly_savings_income = (
-            self.monthly_salary_after_tax() - self.monthly_expenses()
-        )
+        if salary_after_tax is None:
+            salary_after_tax = self.monthly_salary_after_tax()
+        if expenses is None:
+            expenses = self.monthly_expenses()
+
+        monthly_savings_income = salary_after_tax - expenses
 
         return monthly_savings_income
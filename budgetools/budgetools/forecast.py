@@ -1,7 +1,129 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
 import numpy as np
 
 from budgetools.budget import BaseBudget
 
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speedup, not a hard dependency
+    njit = None
+
+MONTHS_PER_YEAR = 12
+
+# Scenario-block budget for the batch forecasts: blocks of roughly this many
+# (scenario, month) elements (~256 KB of float64) stay resident in L2 between
+# the exp and the in-place scaling passes
+_BATCH_BLOCK_ELEMENTS = 32_768
+
+# Annual rates beyond this are treated as input errors (e.g. a percentage
+# entered as a whole number); suitable values lie between 0-1
+_RATE_UPPER_BOUND = 10.0
+
+
+def _to_cents(forecast: np.ndarray) -> np.ndarray:
+    """
+    Converts a currency forecast to whole cents as int64, rounding each value
+    to the nearest cent. Shared by the forecast methods' `cents` option.
+    """
+    forecast = forecast * 100.0
+    np.rint(forecast, out=forecast)
+    return forecast.astype(np.int64)
+
+
+def _validate_rate(value: float, message: str) -> float:
+    """
+    Shared guard for the annual rate setters: returns the value unchanged or
+    raises `ValueError` with the setter-specific message when the rate is
+    negative, non-finite, or above `_RATE_UPPER_BOUND`. Rejecting NaN/inf here
+    keeps a single bad rate from propagating through every forecast element.
+    """
+    # The chained comparison is one guard instead of three: it is False for
+    # negatives, for values past the bound (hence inf), and for NaN
+    if not 0 <= value <= _RATE_UPPER_BOUND:
+        raise ValueError(message)
+    return value
+
+
+def _simulate(
+    forecast_months: int,
+    salary_month: float,
+    monthly_salary_growth: float,
+    expenses_month: float,
+    monthly_inflation: float,
+    monthly_investment_pct: float,
+    investment_rate_monthly: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Scalar recurrence kernel behind `NetWorthSimulation.full_simulation`.
+
+    Kept at module level (plain floats in, NumPy arrays out) so that numba can
+    JIT-compile it when available; without numba it runs as interpreted Python.
+    """
+    # np.empty rather than np.zeros: the loop below writes every element
+    # unconditionally, so the memset pass of zeroing would be wasted bandwidth
+    cumulative_savings_new = np.empty(forecast_months)
+    investment_portfolio = np.empty(forecast_months)
+    net_worth = np.empty(forecast_months)
+
+    savings_running_total = 0.0
+    previous_investment = 0.0
+
+    for i in range(forecast_months):
+        # Grow the salary and expenses levels for the current month
+        salary_month *= 1 + monthly_salary_growth
+        expenses_month *= 1 + monthly_inflation
+        net_income = salary_month - expenses_month
+
+        # Split net income between the investment deposit and savings
+        investment_deposit = net_income * monthly_investment_pct
+        savings_running_total += net_income * (1 - monthly_investment_pct)
+        cumulative_savings_new[i] = savings_running_total
+
+        # Grow the prior portfolio and add the new deposit
+        investment_portfolio[i] = (
+            previous_investment * (1 + investment_rate_monthly) + investment_deposit
+        )
+        previous_investment = investment_portfolio[i]
+
+        # Calculate your net worth at each point in time
+        net_worth[i] = savings_running_total + investment_portfolio[i]
+
+    return cumulative_savings_new, investment_portfolio, net_worth
+
+
+def round_for_display(forecast: np.ndarray) -> np.ndarray:
+    """
+    Rounds a forecast array to 2 decimal places (cents) for presentation.
+
+    The forecast methods return full-precision values so that downstream
+    computations don't propagate rounding noise; call this at the point where
+    flows are shown to a user.
+
+    Parameters
+    ----------
+    forecast : np.ndarray
+        A forecast flow array as returned by the forecast methods.
+
+    Returns
+    -------
+    np.ndarray
+        The forecast rounded to 2 decimal places.
+    """
+    return np.round(forecast, 2)
+
+
+if njit is not None:
+    # An explicit signature makes numba compile the kernel eagerly at import
+    # time (against the on-disk cache) rather than on the first forecast call
+    _simulate = njit(
+        "UniTuple(float64[:], 3)"
+        "(int64, float64, float64, float64, float64, float64, float64)",
+        cache=True,
+    )(_simulate)
+
 
 class SalaryExpensesForecasting(BaseBudget):
     """
@@ -26,6 +148,16 @@ class SalaryExpensesForecasting(BaseBudget):
         Computes an estimate of prospective monthly expenses (cost of living) flows.
     """
 
+    __slots__ = (
+        "years",
+        "_annual_salary_growth",
+        "_annual_inflation",
+        "_monthly_salary_growth",
+        "_monthly_inflation",
+        "_month_index_cache",
+        "_growth_vector_cache",
+    )
+
     def __init__(self, years, salary, tax_rate):
         """
         Instantiates the attributes for the SalaryExpensesForecasting object.
@@ -43,6 +175,10 @@ class SalaryExpensesForecasting(BaseBudget):
         self.years = years
         self._annual_salary_growth = 0
         self._annual_inflation = 0
+        self._monthly_salary_growth = 0.0
+        self._monthly_inflation = 0.0
+        self._month_index_cache = None
+        self._growth_vector_cache = {}
 
     @property
     def annual_salary_growth(self) -> float:
@@ -60,9 +196,14 @@ class SalaryExpensesForecasting(BaseBudget):
 
     @annual_salary_growth.setter
     def annual_salary_growth(self, salary_growth_value: float):
-        if salary_growth_value < 0:
-            raise ValueError("The salary growth rate should be 0 or between 0-1")
-        self._annual_salary_growth = salary_growth_value
+        self._annual_salary_growth = _validate_rate(
+            salary_growth_value, "The salary growth rate should be 0 or between 0-1"
+        )
+        # Derive the periodic (monthly) rate once here; expm1/log1p keep
+        # precision for the small rates these setters typically receive
+        self._monthly_salary_growth = math.expm1(
+            math.log1p(self._annual_salary_growth) / MONTHS_PER_YEAR
+        )
 
     @property
     def annual_inflation(self) -> float:
@@ -80,15 +221,63 @@ class SalaryExpensesForecasting(BaseBudget):
 
     @annual_inflation.setter
     def annual_inflation(self, inflation_value: float):
-        if inflation_value < 0:
-            raise ValueError("The inflation rate should be 0 or between 0-1")
-        self._annual_inflation = inflation_value
+        self._annual_inflation = _validate_rate(
+            inflation_value, "The inflation rate should be 0 or between 0-1"
+        )
+        # Derive the periodic (monthly) rate once here; expm1/log1p keep
+        # precision for the small rates these setters typically receive
+        self._monthly_inflation = math.expm1(
+            math.log1p(inflation_value) / MONTHS_PER_YEAR
+        )
+
+    def _month_index(self, dtype=np.float64) -> np.ndarray:
+        """
+        The month index vector arange(1, forecast months + 1), built once and
+        reused across the sibling forecast methods. The cache is keyed on the
+        (months, dtype) pair so it stays valid if `years` is reassigned.
+        """
+        key = (MONTHS_PER_YEAR * self.years, np.dtype(dtype))
+        if self._month_index_cache is None or self._month_index_cache[0] != key:
+            self._month_index_cache = (key, np.arange(1, key[0] + 1, dtype=dtype))
+        return self._month_index_cache[1]
 
-    def monthly_salary_forecast(self) -> np.ndarray:
+    def _growth_vector(self, monthly_rate: float, dtype=np.float64) -> np.ndarray:
+        """
+        The cumulative geometric growth vector (1 + rate) ** arange(1, months + 1)
+        for a monthly `rate`, computed as exp(k * log1p(rate)) so the whole
+        vector goes through the SIMD exp kernel instead of per-element pow.
+        Cached per (rate, months, dtype): the rates change rarely relative to
+        how often the forecast methods run, so repeat calls skip the exp pass
+        entirely. Callers must treat the returned array as read-only.
+        """
+        key = (monthly_rate, MONTHS_PER_YEAR * self.years, np.dtype(dtype))
+        growth = self._growth_vector_cache.get(key)
+        if growth is None:
+            log_rate = np.dtype(dtype).type(math.log1p(monthly_rate))
+            growth = self._month_index(dtype) * log_rate
+            np.exp(growth, out=growth)
+            self._growth_vector_cache[key] = growth
+        return growth
+
+    def monthly_salary_forecast(
+        self, dtype=np.float64, cents: bool = False
+    ) -> np.ndarray:
         """
         Projects the flows for the monthly salary forecast over the defined period and
         estimated (average) annual salary growth.
 
+        Parameters
+        ----------
+        `dtype` : numpy dtype, optional
+            The floating point width of the returned array. The float64 default
+            keeps cent-level precision; float32 halves memory traffic for
+            bandwidth-bound sweeps where that precision isn't needed.
+        `cents` : bool, optional
+            When True, return the forecast as whole cents in an int64 array
+            (each value rounded to the nearest cent) instead of floating point
+            currency amounts. Integer arrays suit downstream aggregation with
+            no rounding drift.
+
         Returns
         -------
         numpy.ndarray
@@ -103,36 +292,40 @@ class SalaryExpensesForecasting(BaseBudget):
         >>> forecast_living = SalaryExpensesForecasting(years=15, salary=60000,
                                                         tax_rate=0.3)
         >>> forecast_living.annual_salary_growth = 0.05
-        >>> forecast_living.monthly_salary_forecast()
+        >>> from budgetools.forecast import round_for_display
+        >>> round_for_display(forecast_living.monthly_salary_forecast())
         array([3514.26, 3528.58, 3542.95, 3557.39, 3571.88, 3586.43, 3601.04, \
         3615.72, 3630.45, 3645.24, 3660.09, 3675, ...])
         """
-        MONTHS_PER_YEAR = 12
-        # Take the years and convert to months as a forecast parameter
-        forecast_months = MONTHS_PER_YEAR * self.years
-
-        # Converting from an annual rate to a periodic rate
-        monthly_salary_growth = (1 + self._annual_salary_growth) ** (
-            1 / MONTHS_PER_YEAR
-        ) - 1
-
-        # Forecast cumulative salary growth (monthly)
-        cumulative_salary_growth_forecast = np.cumprod(
-            np.repeat(1 + monthly_salary_growth, forecast_months)
-        )
-
-        # Finally calculate the salary forecast
-        salary_forecast = np.round(
-            cumulative_salary_growth_forecast * self.monthly_salary_after_tax(), 2
-        )
+        # Scale the cached cumulative growth vector by the base salary level;
+        # the multiply allocates the fresh output array, leaving the cached
+        # vector untouched (rounding is left to round_for_display)
+        growth = self._growth_vector(self._monthly_salary_growth, dtype)
+        salary_forecast = growth * self.monthly_salary_after_tax()
 
+        if cents:
+            return _to_cents(salary_forecast)
         return salary_forecast
 
-    def monthly_expenses_forecast(self) -> np.ndarray:
+    def monthly_expenses_forecast(
+        self, dtype=np.float64, cents: bool = False
+    ) -> np.ndarray:
         """
         Projects the flows for the monthly expenses (cost of living) forecast over the
         defined period and given expense categories.
 
+        Parameters
+        ----------
+        `dtype` : numpy dtype, optional
+            The floating point width of the returned array. The float64 default
+            keeps cent-level precision; float32 halves memory traffic for
+            bandwidth-bound sweeps where that precision isn't needed.
+        `cents` : bool, optional
+            When True, return the forecast as whole cents in an int64 array
+            (each value rounded to the nearest cent) instead of floating point
+            currency amounts. Integer arrays suit downstream aggregation with
+            no rounding drift.
+
         Returns
         -------
         numpy.ndarray
@@ -152,28 +345,164 @@ class SalaryExpensesForecasting(BaseBudget):
         >>> forecast_living.rent = 1200
         >>> forecast_living.entertainment = 200
         >>> forecast_living.emergency_expenses = 250
-        >>> forecast_living.monthly_expenses_forecast()
+        >>> from budgetools.forecast import round_for_display
+        >>> round_for_display(forecast_living.monthly_expenses_forecast())
         array([2555.25, 2560.52, 2565.79, 2571.08, 2576.37, 2581.68, 2587,
         2592.32, 2597.66, 2603.02, 2608.38, 2613.75, ...])
         """
-        MONTHS_PER_YEAR = 12
-        # Take the years and convert to months as a forecast parameter
-        forecast_months = MONTHS_PER_YEAR * self.years
+        # Scale the cached cumulative growth vector by the base expense level;
+        # the multiply allocates the fresh output array, leaving the cached
+        # vector untouched (rounding is left to round_for_display)
+        growth = self._growth_vector(self._monthly_inflation, dtype)
+        expenses_forecast = growth * self.monthly_expenses()
+
+        if cents:
+            return _to_cents(expenses_forecast)
+        return expenses_forecast
+
+    @classmethod
+    def batch_forecast(
+        cls,
+        years: int,
+        salary,
+        tax_rate,
+        annual_salary_growth,
+        annual_inflation,
+        monthly_expenses,
+        dtype=np.float64,
+        workers: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Projects the monthly salary and expenses forecasts for many scenarios at
+        once via NumPy broadcasting, for sensitivity sweeps or Monte Carlo style
+        analysis where instantiating one object per scenario would be dominated
+        by Python overhead.
+
+        Parameters
+        ----------
+        `years` : int
+            The number of years (period) to estimate forecasts for; shared by
+            every scenario.
+        `salary` : array_like
+            Annual salary (gross) per scenario.
+        `tax_rate` : array_like
+            Tax rate percentage as a decimal per scenario e.g. 30% = 0.3.
+        `annual_salary_growth` : array_like
+            Annual salary growth rate per scenario.
+            The suitable value lies between 0-1.
+        `annual_inflation` : array_like
+            Annual (CPI) inflation rate per scenario.
+            The suitable value lies between 0-1.
+        `monthly_expenses` : array_like
+            Total monthly expenses per scenario, as computed by
+            `BaseBudget.monthly_expenses`.
+        `dtype` : numpy dtype, optional
+            The floating point width of the returned arrays. The float64
+            default keeps cent-level precision; float32 halves the working set
+            for bandwidth-bound sweeps where that precision isn't needed.
+        `workers` : int, optional
+            Number of threads to spread the scenario blocks over. Scenarios
+            are independent and the NumPy kernels release the GIL, so large
+            sweeps scale across cores; the default stays single-threaded.
 
-        # Converting from an annual rate to a periodic rate
-        monthly_inflation = (1 + self.annual_inflation) ** (1 / MONTHS_PER_YEAR) - 1
+        Returns
+        -------
+            - np.ndarray \n
+                The salary forecasts with shape (scenarios, months), where each
+                row matches `monthly_salary_forecast` for that scenario's inputs.
+            - np.ndarray \n
+                The expenses forecasts with shape (scenarios, months), where each
+                row matches `monthly_expenses_forecast` for that scenario's
+                inputs.
 
-        # Forecast cumulative expenses growth (monthly)
-        cumulative_inflation_forecast = np.cumprod(
-            np.repeat(1 + monthly_inflation, forecast_months)
+        Examples
+        --------
+        >>> from budgetools.forecast import SalaryExpensesForecasting
+        >>> salary_forecasts, expenses_forecasts = (
+                SalaryExpensesForecasting.batch_forecast(
+                    years=15,
+                    salary=[60000, 80000],
+                    tax_rate=[0.3, 0.35],
+                    annual_salary_growth=[0.05, 0.03],
+                    annual_inflation=[0.025, 0.025],
+                    monthly_expenses=[2550, 3100],
+                )
+            )
+        >>> salary_forecasts.shape
+        (2, 180)
+        """
+        (
+            salary,
+            tax_rate,
+            annual_salary_growth,
+            annual_inflation,
+            monthly_expenses,
+        ) = np.broadcast_arrays(
+            *np.atleast_1d(
+                salary, tax_rate, annual_salary_growth, annual_inflation,
+                monthly_expenses,
+            )
         )
 
-        # Finally calculate the expenses forecast
-        expenses_forecast = np.round(
-            cumulative_inflation_forecast * self.monthly_expenses(), 2
+        # Reject bad scenarios up front rather than computing and discarding
+        # them; a single NaN/inf rate would contaminate its whole forecast row
+        for rates, message in (
+            (annual_salary_growth, "The salary growth rate should be 0 or between 0-1"),
+            (annual_inflation, "The inflation rate should be 0 or between 0-1"),
+        ):
+            if np.any(rates < 0) or not np.all(
+                np.isfinite(rates) & (rates <= _RATE_UPPER_BOUND)
+            ):
+                raise ValueError(message)
+
+        # Take the years and convert to months as a forecast parameter
+        forecast_months = MONTHS_PER_YEAR * years
+        months = np.arange(1, forecast_months + 1, dtype=dtype)
+
+        # The log of the periodic (monthly) growth factor per scenario:
+        # log1p(annual) / 12 == log1p(monthly rate), narrowed to the requested
+        # dtype so the broadcasted exp runs at that width
+        log_salary_growth = (np.log1p(annual_salary_growth) / MONTHS_PER_YEAR).astype(
+            dtype
         )
+        log_inflation = (np.log1p(annual_inflation) / MONTHS_PER_YEAR).astype(dtype)
 
-        return expenses_forecast
+        # Each forecast is one broadcasted exp(k * log1p(rate)) geometric
+        # progression of shape (scenarios, months), scaled in place by its base.
+        # Evaluate in scenario blocks so each block's working set stays in
+        # cache between the exp and the scaling pass
+        base_salary = (salary * (1 - tax_rate) / MONTHS_PER_YEAR).astype(dtype)
+        base_expenses = np.asarray(monthly_expenses, dtype=dtype)
+
+        scenario_count = salary.shape[0]
+        salary_forecasts = np.empty((scenario_count, forecast_months), dtype=dtype)
+        expenses_forecasts = np.empty((scenario_count, forecast_months), dtype=dtype)
+
+        block = max(1, _BATCH_BLOCK_ELEMENTS // forecast_months)
+
+        def fill_block(start: int):
+            rows = slice(start, start + block)
+            np.exp(
+                log_salary_growth[rows, None] * months[None, :],
+                out=salary_forecasts[rows],
+            )
+            salary_forecasts[rows] *= base_salary[rows, None]
+            np.exp(
+                log_inflation[rows, None] * months[None, :],
+                out=expenses_forecasts[rows],
+            )
+            expenses_forecasts[rows] *= base_expenses[rows, None]
+
+        starts = range(0, scenario_count, block)
+        if workers is not None and workers > 1:
+            # Blocks write disjoint row ranges, so they can run concurrently
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(fill_block, starts))
+        else:
+            for start in starts:
+                fill_block(start)
+
+        return salary_forecasts, expenses_forecasts
 
 
 class NetWorthSimulation(SalaryExpensesForecasting):
@@ -203,6 +532,9 @@ class NetWorthSimulation(SalaryExpensesForecasting):
     `savings_forecast`
         Computes an estimate of the final net worth and an array containing
         cumulative saving flows respectively for the given period.
+    `final_net_worth`
+        Computes only the final total savings for the given period, skipping
+        the cumulative savings array when the flows aren't needed.
     `monthly_income_investment`
         Computes an array containing investment deposit forecast flows, an array
         containing savings forecast which is now considered in tandem with investment,
@@ -213,8 +545,17 @@ class NetWorthSimulation(SalaryExpensesForecasting):
         estimated annual investment return, and an array containing overall net worth
         i.e. total investment portfolio flows + cumulative saving flows over the defined
         period.
+    `full_simulation`
+        Computes the same arrays as `net_worth_savings_investments` in a single pass
+        over the monthly periods rather than one traversal per intermediate series.
     """
 
+    __slots__ = (
+        "monthly_investment_pct",
+        "_annual_investment_return",
+        "_monthly_investment_return",
+    )
+
     def __init__(
         self, years: int, salary: int, tax_rate: float, monthly_investment_pct: float
     ):
@@ -235,6 +576,7 @@ class NetWorthSimulation(SalaryExpensesForecasting):
         super().__init__(years, salary, tax_rate)
         self.monthly_investment_pct = monthly_investment_pct
         self._annual_investment_return = 0
+        self._monthly_investment_return = 0.0
 
     @property
     def annual_investment_return(self) -> float:
@@ -252,9 +594,53 @@ class NetWorthSimulation(SalaryExpensesForecasting):
 
     @annual_investment_return.setter
     def annual_investment_return(self, investment_return_value: float):
-        if investment_return_value < 0:
-            raise ValueError("The inflation rate should be 0 or between 0-1")
-        self._annual_investment_return = investment_return_value
+        self._annual_investment_return = _validate_rate(
+            investment_return_value, "The inflation rate should be 0 or between 0-1"
+        )
+        # Derive the periodic (monthly) rate once here; expm1/log1p keep
+        # precision for the small rates these setters typically receive
+        self._monthly_investment_return = math.expm1(
+            math.log1p(investment_return_value) / MONTHS_PER_YEAR
+        )
+
+    def _net_income_forecast(self) -> np.ndarray:
+        """
+        The monthly net income flows (salary forecast less expenses forecast),
+        computed once here so the public forecast methods don't each rebuild
+        the salary and expenses arrays.
+        """
+        return self.monthly_salary_forecast() - self.monthly_expenses_forecast()
+
+    def final_net_worth(self) -> float:
+        """
+        Computes only the final total savings over the defined period.
+
+        This is the same value as the first element of the `savings_forecast`
+        return, but as a plain sum over the net income flows it skips
+        allocating the cumulative savings array when only the headline figure
+        is wanted.
+
+        Returns
+        -------
+        float
+            The final total savings over the defined period.
+
+        Examples
+        --------
+        >>> from budgetools.forecast import NetWorthSimulation
+        >>> forecast_net_worth = NetWorthSimulation(years=25, salary=60000, tax_rate=0.3,
+        monthly_investment_pct=0.3
+        )
+        >>> forecast_net_worth.rent = 1200
+        >>> forecast_net_worth.food_daily = 30
+        >>> forecast_net_worth.entertainment = 200
+        >>> forecast_net_worth.emergency_expenses = 250
+        >>> forecast_net_worth.annual_inflation = 0.025
+        >>> forecast_net_worth.annual_salary_growth = 0.05
+        >>> forecast_net_worth.final_net_worth()
+        999094.7599261748
+        """
+        return float(self._net_income_forecast().sum())
 
     def savings_forecast(self) -> tuple[float | int, np.ndarray]:
         """
@@ -287,16 +673,15 @@ class NetWorthSimulation(SalaryExpensesForecasting):
         >>> forecast_net_worth.annual_salary_growth = 0.05
         >>> final_net_worth, cumulative_savings = forecast_net_worth.savings_forecast()
         >>> final_net_worth
-        999094.6900000005
-        >>> cumulative_savings
-        array([959.01, 1927.07, 2904.23, 3890.54, 4886.05, 5890.8,
-        6904.84, 7928.24, 8961.03, 10003.25, 11054.96, 12116.21, ...])
+        999094.7599261747
+        >>> from budgetools.forecast import round_for_display
+        >>> round_for_display(cumulative_savings)
+        array([959.01, 1927.07, 2904.23, 3890.54, 4886.05, 5890.81,
+        6904.85, 7928.24, 8961.03, 10003.25, 11054.96, 12116.21, ...])
         """
 
         # Calculate savings for each month
-        savings_forecast = (
-            self.monthly_salary_forecast() - self.monthly_expenses_forecast()
-        )
+        savings_forecast = self._net_income_forecast()
 
         # Calculate cumulative savings over time
         cumulative_savings = np.cumsum(savings_forecast)
@@ -351,26 +736,26 @@ class NetWorthSimulation(SalaryExpensesForecasting):
                 savings_forecast_post_investment,
                 cumulative_savings_new,
             ) = forecast_net_worth.monthly_income_investment()
-        >>> investment_deposit_forecast
-        array([287.703, 290.418, 293.148, 295.893, 298.653, 301.425, 304.212,
-        307.02 , 309.837, 312.666, 315.513, 318.375, ...])
-        >>> savings_forecast_post_investment
-        array([671.307, 677.642, 684.012, 690.417, 696.857, 703.325, 709.828,
-        716.38 , 722.953, 729.554, 736.197, 742.875, ...])
-        >>> cumulative_savings_new
-        array([ 671.307, 1348.949, 2032.961, 2723.378, 3420.235, 4123.56,
-        4833.388, 5549.768, 6272.721, 7002.275, 7738.472, 8481.347, ...])
+        >>> from budgetools.forecast import round_for_display
+        >>> round_for_display(investment_deposit_forecast)
+        array([287.7 , 290.42, 293.15, 295.89, 298.65, 301.43, 304.21,
+        307.02, 309.83, 312.67, 315.51, 318.38, ...])
+        >>> round_for_display(savings_forecast_post_investment)
+        array([671.3 , 677.64, 684.01, 690.42, 696.86, 703.33, 709.83,
+        716.37, 722.95, 729.56, 736.2 , 742.88, ...])
+        >>> round_for_display(cumulative_savings_new)
+        array([ 671.3 , 1348.95, 2032.96, 2723.38, 3420.24, 4123.56,
+        4833.4 , 5549.77, 6272.72, 7002.27, 7738.47, 8481.35, ...])
         """
 
+        # Compute the net income once, then split it between the accounts
+        net_income_forecast = self._net_income_forecast()
+
         # Compute monthly deposit for investment account
-        investment_deposit_forecast = (
-            self.monthly_salary_forecast() - self.monthly_expenses_forecast()
-        ) * self.monthly_investment_pct
+        investment_deposit_forecast = net_income_forecast * self.monthly_investment_pct
 
         # Rest goes into savings account
-        savings_forecast_new = (
-            self.monthly_salary_forecast() - self.monthly_expenses_forecast()
-        ) * (1 - self.monthly_investment_pct)
+        savings_forecast_new = net_income_forecast - investment_deposit_forecast
 
         # Calculate cumulative savings over time
         cumulative_savings_new = np.cumsum(savings_forecast_new)
@@ -428,26 +813,16 @@ class NetWorthSimulation(SalaryExpensesForecasting):
                 investment_portfolio,
                 net_worth,
             ) = forecast_net_worth.net_worth_savings_investments()
-        >>> investment_portfolio
-        array([287.703, 579.74771459, 876.17369246, 1177.0207059,
-        1482.32875209, 1792.13505437, 2106.48004652, 2425.41039096,
-        2748.96101393, 3077.17003917, 3410.08180595, 3747.73790427, ...])
-        >>> net_worth
-        array([959.01, 1928.69671459, 2909.13469246, 3900.3987059,
-        4902.56375209, 5915.69505437, 6939.86804652, 7975.17839096,
-        9021.68201393, 10079.44503917, 11148.55380595, 12229.08490427, ...])
-        """
-        MONTHS_PER_YEAR = 12
-        # gather the years as distinct months
-        forecast_months = MONTHS_PER_YEAR * self.years
-
-        # Set the annual investment return
-        investment_rate_annual = self.annual_investment_return
-
-        # Compute the monthly investment return
-        investment_rate_monthly = (1 + investment_rate_annual) ** (
-            1 / MONTHS_PER_YEAR
-        ) - 1
+        >>> from budgetools.forecast import round_for_display
+        >>> round_for_display(investment_portfolio)
+        array([287.7 , 579.75, 876.17, 1177.02, 1482.33, 1792.14,
+        2106.48, 2425.41, 2748.96, 3077.17, 3410.08, 3747.74, ...])
+        >>> round_for_display(net_worth)
+        array([959.01, 1928.69, 2909.14, 3900.4, 4902.57, 5915.7,
+        6939.88, 7975.18, 9021.68, 10079.44, 11148.55, 12229.08, ...])
+        """
+        # The monthly investment return derived when the annual rate was set
+        investment_rate_monthly = self._monthly_investment_return
 
         # Retrieve the cumulated savings
         (
@@ -456,29 +831,303 @@ class NetWorthSimulation(SalaryExpensesForecasting):
             cumulative_savings_new,
         ) = self.monthly_income_investment()
 
-        # Create initial (empty) NumPy arrays the size of forecast months
-        investment_portfolio, net_worth = np.zeros(shape=(forecast_months,)), np.zeros(
-            shape=(forecast_months,)
+        # The compounding recurrence portfolio[i] = portfolio[i - 1] * (1 + r)
+        # + deposit[i] has the closed form: discount each deposit back to the
+        # first month, take the running total, then compound it forward again
+        if investment_rate_monthly == 0:
+            investment_portfolio = np.cumsum(investment_deposit_forecast)
+        else:
+            # Reuse the cached growth vector; dividing by (1 + r) shifts the
+            # exponent down one month, turning (1 + r) ** arange(1, n + 1)
+            # into (1 + r) ** arange(n) without mutating the cached array
+            compound = self._growth_vector(investment_rate_monthly) / (
+                1 + investment_rate_monthly
+            )
+            investment_portfolio = compound * np.cumsum(
+                investment_deposit_forecast / compound
+            )
+
+        # Calculate your net worth at each point in time
+        net_worth = cumulative_savings_new + investment_portfolio
+
+        return cumulative_savings_new, investment_portfolio, net_worth
+
+    def full_simulation(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes the same (cumulative savings, investment portfolio, net worth)
+        arrays as `net_worth_savings_investments`, but accumulates salary growth,
+        expenses inflation, savings, investment deposits, and portfolio compounding
+        in a single pass over the monthly periods instead of one full traversal per
+        intermediate series.
+
+        Returns
+        -------
+            - np.ndarray \n
+                Returns the array of modified cumulative savings flows, where each
+                element in the array is an estimate of the forecasted savings while
+                investing a percentage of income (cumulated since the initial period).
+            - np.ndarray \n
+                Returns the array of cumulative investment portfolio flows, where each
+                element in the array is an estimate of the forecasted investment
+                rate of returns post investment deposit flows (cumulated since the
+                initial period).
+            - np.ndarray \n
+                Returns the array of cumulative net worth (cumulative savings +
+                cumulative investment returns), where each element in the array is an
+                estimate of the forecasted net worth flows (cumulated since the initial
+                period).
+
+        Examples
+        --------
+        >>> from budgetools.forecast import NetWorthSimulation
+        >>> forecast_net_worth = NetWorthSimulation(years=25, salary=60000,
+        tax_rate=0.3, monthly_investment_pct=0.3
+        )
+        >>> forecast_net_worth.rent = 1200
+        >>> forecast_net_worth.food_daily = 30
+        >>> forecast_net_worth.entertainment = 200
+        >>> forecast_net_worth.emergency_expenses = 250
+        >>> forecast_net_worth.annual_inflation = 0.025
+        >>> forecast_net_worth.annual_salary_growth = 0.05
+        >>> forecast_net_worth.annual_investment_return = 0.07
+        >>> (
+                cumulated_savings_new,
+                investment_portfolio,
+                net_worth,
+            ) = forecast_net_worth.full_simulation()
+        >>> from budgetools.forecast import round_for_display
+        >>> round_for_display(net_worth)
+        array([959.01, 1928.69, 2909.14, 3900.4, 4902.57, 5915.7,
+        6939.88, 7975.18, ...])
+        """
+        # gather the years as distinct months
+        forecast_months = MONTHS_PER_YEAR * self.years
+
+        # Hand the scalar recurrence off to the module-level kernel, which is
+        # JIT-compiled when numba is installed, using the periodic rates
+        # derived when the annual rates were set
+        return _simulate(
+            forecast_months,
+            float(self.monthly_salary_after_tax()),
+            self._monthly_salary_growth,
+            float(self.monthly_expenses()),
+            self._monthly_inflation,
+            float(self.monthly_investment_pct),
+            self._monthly_investment_return,
         )
 
-        for i in range(forecast_months):
-            # Find the previous investment deposit amount
-            if i == 0:
-                previous_investment = 0
-            else:
-                previous_investment = investment_portfolio[i - 1]
+    @classmethod
+    def batch_simulation(
+        cls,
+        years: int,
+        salary,
+        tax_rate,
+        annual_salary_growth,
+        annual_inflation,
+        monthly_expenses,
+        monthly_investment_pct,
+        annual_investment_return,
+        dtype=np.float64,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Runs the net worth simulation for many scenarios at once via NumPy
+        broadcasting, for sensitivity sweeps or Monte Carlo style analysis over
+        salary growth, inflation, and investment return combinations where one
+        `NetWorthSimulation` instance per scenario would be dominated by Python
+        overhead.
 
-            # Calculate the value of your previous investments, which have grown
-            previous_investment_growth = previous_investment * (
-                1 + investment_rate_monthly
+        Parameters
+        ----------
+        `years` : int
+            The number of years (period) to simulate; shared by every scenario.
+        `salary` : array_like
+            Annual salary (gross) per scenario.
+        `tax_rate` : array_like
+            Tax rate percentage as a decimal per scenario e.g. 30% = 0.3.
+        `annual_salary_growth` : array_like
+            Annual salary growth rate per scenario.
+            The suitable value lies between 0-1.
+        `annual_inflation` : array_like
+            Annual (CPI) inflation rate per scenario.
+            The suitable value lies between 0-1.
+        `monthly_expenses` : array_like
+            Total monthly expenses per scenario, as computed by
+            `BaseBudget.monthly_expenses`.
+        `monthly_investment_pct` : array_like
+            The percentage of monthly savings invested per scenario.
+        `annual_investment_return` : array_like
+            Annual investment rate of return per scenario.
+            The suitable value lies between 0-1.
+        `dtype` : numpy dtype, optional
+            The floating point width of the returned arrays. The float64
+            default keeps cent-level precision; float32 halves the working set
+            for bandwidth-bound sweeps where that precision isn't needed.
+
+        Returns
+        -------
+            - np.ndarray \n
+                The cumulative savings with shape (scenarios, months), where
+                each row matches `net_worth_savings_investments`'s first array
+                for that scenario's inputs.
+            - np.ndarray \n
+                The investment portfolio flows with shape (scenarios, months).
+            - np.ndarray \n
+                The net worth flows (cumulative savings + investment
+                portfolio) with shape (scenarios, months).
+
+        Examples
+        --------
+        >>> from budgetools.forecast import NetWorthSimulation
+        >>> savings, portfolios, net_worths = NetWorthSimulation.batch_simulation(
+                years=25,
+                salary=[60000, 80000],
+                tax_rate=0.3,
+                annual_salary_growth=[0.05, 0.03],
+                annual_inflation=0.025,
+                monthly_expenses=2550,
+                monthly_investment_pct=0.3,
+                annual_investment_return=[0.07, 0.05],
+            )
+        >>> net_worths.shape
+        (2, 300)
+        """
+        (
+            salary,
+            tax_rate,
+            annual_salary_growth,
+            annual_inflation,
+            monthly_expenses,
+            monthly_investment_pct,
+            annual_investment_return,
+        ) = np.broadcast_arrays(
+            *np.atleast_1d(
+                salary, tax_rate, annual_salary_growth, annual_inflation,
+                monthly_expenses, monthly_investment_pct,
+                annual_investment_return,
             )
+        )
+
+        if np.any(annual_investment_return < 0) or not np.all(
+            np.isfinite(annual_investment_return)
+            & (annual_investment_return <= _RATE_UPPER_BOUND)
+        ):
+            raise ValueError("The inflation rate should be 0 or between 0-1")
+
+        # The salary/expenses legs are the existing broadcasted batch forecast
+        # (which validates the growth and inflation rates at entry)
+        salary_forecasts, expenses_forecasts = cls.batch_forecast(
+            years=years,
+            salary=salary,
+            tax_rate=tax_rate,
+            annual_salary_growth=annual_salary_growth,
+            annual_inflation=annual_inflation,
+            monthly_expenses=monthly_expenses,
+            dtype=dtype,
+        )
+
+        # Split net income between deposits and savings, reusing the salary
+        # buffer for net income and the expenses buffer for the savings leg
+        investment_pct = np.asarray(monthly_investment_pct, dtype=dtype)
+        net_income = salary_forecasts
+        net_income -= expenses_forecasts
+        deposits = net_income * investment_pct[:, None]
+        cumulative_savings = expenses_forecasts
+        np.subtract(net_income, deposits, out=cumulative_savings)
+        np.cumsum(cumulative_savings, axis=1, out=cumulative_savings)
 
-            # Add your new deposit to your investment portfolio
-            investment_portfolio[i] = (
-                previous_investment_growth + investment_deposit_forecast[i]
+        # Closed form of the compounding recurrence per row: discount each
+        # deposit back to the first month, take the running total, then
+        # compound it forward again. At a zero rate the compounding vector is
+        # all ones and the expression degrades gracefully to a plain cumsum
+        forecast_months = MONTHS_PER_YEAR * years
+        months = np.arange(forecast_months, dtype=dtype)
+        log_return = (np.log1p(annual_investment_return) / MONTHS_PER_YEAR).astype(
+            dtype
+        )
+        compound = np.exp(log_return[:, None] * months[None, :])
+        investment_portfolio = compound * np.cumsum(deposits / compound, axis=1)
+
+        net_worth = cumulative_savings + investment_portfolio
+
+        return cumulative_savings, investment_portfolio, net_worth
+
+
+@dataclass
+class ScenarioSet:
+    """
+    A struct-of-arrays record of forecast scenarios for sweep analysis.
+
+    Each parameter is held as a 1-D NumPy array with one element per scenario
+    (scalars are broadcast), so a sweep is a handful of contiguous arrays
+    rather than one Python object per scenario.
+
+    Attributes
+    ----------
+    `years` : int
+        The number of years (period) to estimate forecasts for; shared by
+        every scenario.
+    `salary` : np.ndarray
+        Annual salary (gross) per scenario.
+    `tax_rate` : np.ndarray
+        Tax rate percentage as a decimal per scenario e.g. 30% = 0.3.
+    `annual_salary_growth` : np.ndarray
+        Annual salary growth rate per scenario.
+    `annual_inflation` : np.ndarray
+        Annual (CPI) inflation rate per scenario.
+    `monthly_expenses` : np.ndarray
+        Total monthly expenses per scenario.
+
+    Methods
+    -------
+    `forecasts`
+        Computes the (scenarios, months) salary and expenses forecasts for
+        the whole set in one broadcasted pass.
+    """
+
+    years: int
+    salary: np.ndarray
+    tax_rate: np.ndarray
+    annual_salary_growth: np.ndarray
+    annual_inflation: np.ndarray
+    monthly_expenses: np.ndarray
+
+    def __post_init__(self):
+        (
+            self.salary,
+            self.tax_rate,
+            self.annual_salary_growth,
+            self.annual_inflation,
+            self.monthly_expenses,
+        ) = np.broadcast_arrays(
+            *np.atleast_1d(
+                self.salary,
+                self.tax_rate,
+                self.annual_salary_growth,
+                self.annual_inflation,
+                self.monthly_expenses,
             )
+        )
 
-            # Calculate your net worth at each point in time
-            net_worth[i] = cumulative_savings_new[i] + investment_portfolio[i]
+    def __len__(self) -> int:
+        return self.salary.shape[0]
 
-        return cumulative_savings_new, investment_portfolio, net_worth
+    def forecasts(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the salary and expenses forecasts for every scenario in the
+        set via `SalaryExpensesForecasting.batch_forecast`.
+
+        Returns
+        -------
+            - np.ndarray \n
+                The salary forecasts with shape (scenarios, months).
+            - np.ndarray \n
+                The expenses forecasts with shape (scenarios, months).
+        """
+        return SalaryExpensesForecasting.batch_forecast(
+            years=self.years,
+            salary=self.salary,
+            tax_rate=self.tax_rate,
+            annual_salary_growth=self.annual_salary_growth,
+            annual_inflation=self.annual_inflation,
+            monthly_expenses=self.monthly_expenses,
+        )
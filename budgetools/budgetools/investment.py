@@ -1,9 +1,17 @@
-import numpy_financial as npf
+import numpy as np
+
+# Shared by both utilities so the guard doesn't rebuild the string per call
+_NEGATIVE_ARGS_MESSAGE = (
+    "No arguments in the equation should be negative, \
+            please redefine"
+)
 
 
 def monthly_amount_to_investment(
-    avg_ror: float, years: int, desired_amount: int
-) -> float:
+    avg_ror: float | np.ndarray,
+    years: int | np.ndarray,
+    desired_amount: int | np.ndarray,
+) -> float | np.ndarray:
     """
     A function utility that computes the sum of money needed to be
     invested (every month) to reach a desired
@@ -11,43 +19,57 @@ def monthly_amount_to_investment(
 
     Parameters
     ----------
-    avg_ror : float
+    avg_ror : float | numpy.ndarray
         Average rate of return (RoR) that is assumed for the given investment
         allocation to be growing over a period of time (years).
-    years : int
+    years : int | numpy.ndarray
         Number of years an individual will consistently invest.
-    desired_amount : int
+    desired_amount : int | numpy.ndarray
         The sum of money accumulated (at the end of the term) that an
         individual aims to achieve.
 
     Returns
     -------
-    float
+    float | numpy.ndarray
        The monthly amount needed to consistently invest based on setting of
-       years, ror, and target investment amount.
+       years, ror, and target investment amount. The arguments broadcast
+       against each other, so a whole parameter sweep can be evaluated in a
+       single call; scalar inputs return a plain float.
     """
     MONTHS_PER_YEAR = 12
-    fv = desired_amount
+    fv = np.asarray(desired_amount)
+    avg_ror = np.asarray(avg_ror)
+    years = np.asarray(years)
 
-    if avg_ror < 0 or years < 0 or desired_amount < 0:
-        raise RuntimeError(
-            "No arguments in the equation should be negative, \
-            please redefine"
-        )
+    # One comparison against the smallest input instead of three np.any
+    # passes (each of which would allocate a boolean temporary)
+    if min(avg_ror.min(), years.min(), fv.min()) < 0:
+        raise RuntimeError(_NEGATIVE_ARGS_MESSAGE)
+
+    # The annuity payment with pv=0 reduces to fv * r / ((1+r)^n - 1), so the
+    # general npf.pmt machinery (argument parsing, broadcasting, rate branches)
+    # is bypassed for a handful of flops per element. The monthly rate uses
+    # expm1/log1p rather than ** (1/12): it skips the general pow(double,
+    # double) path and keeps precision for small rates, matching the setters
+    # in forecast.py
+    rate = np.expm1(np.log1p(avg_ror) / MONTHS_PER_YEAR)
+    nper = MONTHS_PER_YEAR * years
 
-    return -1 * (
-        npf.pmt(
-            rate=((1 + avg_ror) ** (1 / MONTHS_PER_YEAR) - 1),
-            nper=MONTHS_PER_YEAR * years,
-            pv=0,
-            fv=fv,
-        )
-    )
+    # np.where evaluates both branches, so silence the harmless
+    # divide-by-zero from the unselected branch where rate == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payment = np.where(rate == 0, fv / nper, fv * rate / ((1 + rate) ** nper - 1))
+
+    if payment.ndim == 0:
+        return float(payment)
+    return payment
 
 
 def investment_inflation_adjustment(
-    avg_inflation: float, years: int, desired_amount: int
-) -> float:
+    avg_inflation: float | np.ndarray,
+    years: int | np.ndarray,
+    desired_amount: int | np.ndarray,
+) -> float | np.ndarray:
     """
     A function utility that computes the inflation adjusted target investment amount
     over a given defined period of time.
@@ -59,28 +81,36 @@ def investment_inflation_adjustment(
 
     Parameters
     ----------
-    avg_inflation : float
+    avg_inflation : float | numpy.ndarray
         Average rate of inflation. Assumed to be taken from a price index e.g. CPI
         over a period of time (years).
-    years : int
+    years : int | numpy.ndarray
         Number of years an individual will consistently invest.
-    desired_amount : int
+    desired_amount : int | numpy.ndarray
         The sum of money accumulated (at the end of the term) that an
         individual aims to achieve.
 
     Returns
     -------
-    float
+    float | numpy.ndarray
         The real (future) value (adjusted for inflation) of the target investment amount
-        over the defined period.
+        over the defined period. The arguments broadcast against each other,
+        so a whole parameter sweep can be evaluated in a single call; scalar
+        inputs return a plain float.
     """
-    fv = -1 * desired_amount
-    rate = avg_inflation
+    avg_inflation = np.asarray(avg_inflation)
+    years = np.asarray(years)
+    desired_amount = np.asarray(desired_amount)
 
-    if avg_inflation < 0 or years < 0 or desired_amount < 0:
-        raise RuntimeError(
-            "No arguments in the equation should be negative, \
-            please redefine"
-        )
+    # One comparison against the smallest input instead of three np.any
+    # passes (each of which would allocate a boolean temporary)
+    if min(avg_inflation.min(), years.min(), desired_amount.min()) < 0:
+        raise RuntimeError(_NEGATIVE_ARGS_MESSAGE)
+
+    # npf.pv with pmt=0 is plain discounting, -fv / (1+r)^n; computing it
+    # directly (with the sign folded in) avoids the library call overhead
+    adjusted = desired_amount / (1 + avg_inflation) ** years
 
-    return npf.pv(rate=rate, nper=years, pmt=0, fv=fv)
+    if adjusted.ndim == 0:
+        return float(adjusted)
+    return adjusted
@@ -8,6 +8,6 @@ setup(
     name="budgetools",
     packages=find_packages(include=["budgetools", "budgetools.*"]),
     version="0.1.0",
-    install_requires=["numpy>=1.18.0", "numpy-financial>=1.0.0", "pandas"],
+    install_requires=["numpy>=1.18.0", "pandas"],
     python_requires=">=3.6",
 )
@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+from budgetools.forecast import (
+    NetWorthSimulation,
+    SalaryExpensesForecasting,
+    ScenarioSet,
+)
+
+
+def test_batch_forecast_matches_single_scenario_methods():
+    forecast_living = SalaryExpensesForecasting(years=15, salary=60000, tax_rate=0.3)
+    forecast_living.annual_salary_growth = 0.05
+    forecast_living.rent = 1200
+    forecast_living.food_daily = 30
+    forecast_living.entertainment = 200
+    forecast_living.emergency_expenses = 250
+    forecast_living.annual_inflation = 0.025
+
+    salary_forecasts, expenses_forecasts = SalaryExpensesForecasting.batch_forecast(
+        years=15,
+        salary=[60000, 80000],
+        tax_rate=[0.3, 0.3],
+        annual_salary_growth=[0.05, 0.05],
+        annual_inflation=[0.025, 0.025],
+        monthly_expenses=[forecast_living.monthly_expenses(), 3100],
+    )
+
+    assert salary_forecasts.shape == (2, 180)
+    assert expenses_forecasts.shape == (2, 180)
+    # The first scenario mirrors the instance inputs
+    assert np.allclose(salary_forecasts[0], forecast_living.monthly_salary_forecast())
+    assert np.allclose(
+        expenses_forecasts[0], forecast_living.monthly_expenses_forecast()
+    )
+
+
+@pytest.mark.parametrize(
+    "bad_rate", [float("nan"), float("inf"), 100.0, -0.05]
+)
+def test_rate_setters_reject_invalid_values(bad_rate):
+    forecast_living = SalaryExpensesForecasting(years=5, salary=60000, tax_rate=0.3)
+    simulation = NetWorthSimulation(
+        years=5, salary=60000, tax_rate=0.3, monthly_investment_pct=0.3
+    )
+
+    with pytest.raises(ValueError):
+        forecast_living.annual_salary_growth = bad_rate
+    with pytest.raises(ValueError):
+        forecast_living.annual_inflation = bad_rate
+    with pytest.raises(ValueError):
+        simulation.annual_investment_return = bad_rate
+
+
+def test_batch_forecast_rejects_bad_rate_arrays():
+    with pytest.raises(ValueError):
+        SalaryExpensesForecasting.batch_forecast(
+            years=2,
+            salary=60000,
+            tax_rate=0.3,
+            annual_salary_growth=[0.05, float("nan")],
+            annual_inflation=0.025,
+            monthly_expenses=2550,
+        )
+    with pytest.raises(ValueError):
+        SalaryExpensesForecasting.batch_forecast(
+            years=2,
+            salary=60000,
+            tax_rate=0.3,
+            annual_salary_growth=0.05,
+            annual_inflation=[0.025, -0.01],
+            monthly_expenses=2550,
+        )
+
+
+def test_forecast_methods_return_int64_whole_cents():
+    forecast_living = SalaryExpensesForecasting(years=2, salary=60000, tax_rate=0.3)
+    forecast_living.annual_salary_growth = 0.05
+    forecast_living.rent = 1200
+    forecast_living.annual_inflation = 0.025
+
+    salary_cents = forecast_living.monthly_salary_forecast(cents=True)
+    expenses_cents = forecast_living.monthly_expenses_forecast(cents=True)
+
+    assert salary_cents.dtype == np.int64
+    assert expenses_cents.dtype == np.int64
+    assert np.array_equal(
+        salary_cents,
+        np.rint(forecast_living.monthly_salary_forecast() * 100).astype(np.int64),
+    )
+    assert np.array_equal(
+        expenses_cents,
+        np.rint(forecast_living.monthly_expenses_forecast() * 100).astype(np.int64),
+    )
+
+
+def test_batch_forecast_broadcasts_scalar_inputs():
+    salary_forecasts, expenses_forecasts = SalaryExpensesForecasting.batch_forecast(
+        years=2,
+        salary=60000,
+        tax_rate=0.3,
+        annual_salary_growth=0.05,
+        annual_inflation=0.025,
+        monthly_expenses=2550,
+    )
+
+    assert salary_forecasts.shape == (1, 24)
+    assert expenses_forecasts.shape == (1, 24)
+
+
+def test_scenario_set_matches_batch_forecast():
+    scenarios = ScenarioSet(
+        years=5,
+        salary=[60000, 80000],
+        tax_rate=0.3,
+        annual_salary_growth=[0.05, 0.03],
+        annual_inflation=0.025,
+        monthly_expenses=2550,
+    )
+
+    assert len(scenarios) == 2
+    salary_forecasts, expenses_forecasts = scenarios.forecasts()
+    assert salary_forecasts.shape == (2, 60)
+    assert expenses_forecasts.shape == (2, 60)
+
+
+def test_batch_simulation_matches_single_scenario_methods():
+    simulation = NetWorthSimulation(
+        years=10, salary=60000, tax_rate=0.3, monthly_investment_pct=0.3
+    )
+    simulation.rent = 1200
+    simulation.food_daily = 30
+    simulation.entertainment = 200
+    simulation.emergency_expenses = 250
+    simulation.annual_inflation = 0.025
+    simulation.annual_salary_growth = 0.05
+    simulation.annual_investment_return = 0.07
+
+    savings, portfolios, net_worths = NetWorthSimulation.batch_simulation(
+        years=10,
+        salary=[60000, 80000],
+        tax_rate=0.3,
+        annual_salary_growth=[0.05, 0.03],
+        annual_inflation=0.025,
+        monthly_expenses=simulation.monthly_expenses(),
+        monthly_investment_pct=0.3,
+        annual_investment_return=[0.07, 0.05],
+    )
+
+    assert savings.shape == (2, 120)
+    assert portfolios.shape == (2, 120)
+    assert net_worths.shape == (2, 120)
+    # The first scenario mirrors the instance inputs
+    expected = simulation.net_worth_savings_investments()
+    for row, series in zip((savings[0], portfolios[0], net_worths[0]), expected):
+        assert np.allclose(row, series)
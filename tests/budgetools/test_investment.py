@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+import numpy as np
 import pytest
 from pytest import approx  # Used for float comparisons
 
@@ -57,6 +58,70 @@ def test_investment_inflation_adjustment(params_3pcinf_25yrs_million):
     assert return_value == approx(477605.57)
 
 
+def test_monthly_to_investment_broadcasts_array_inputs(params_7pc_25yrs_million):
+    return_values = monthly_amount_to_investment(
+        avg_ror=np.array([0.05, params_7pc_25yrs_million.rate_of_return]),
+        years=params_7pc_25yrs_million.years,
+        desired_amount=params_7pc_25yrs_million.target,
+    )
+    assert isinstance(return_values, np.ndarray)
+    assert return_values.shape == (2,)
+    # Each element matches the equivalent scalar call
+    assert return_values[0] == approx(monthly_amount_to_investment(0.05, 25, 1_000_000))
+    assert return_values[1] == approx(1277.07)
+
+
+def test_monthly_to_investment_zero_rate_is_plain_division():
+    # At a zero rate of return the annuity reduces to fv / months
+    assert monthly_amount_to_investment(0.0, 10, 50_000) == approx(50_000 / 120)
+
+    return_values = monthly_amount_to_investment(
+        avg_ror=np.array([0.0, 0.05]), years=10, desired_amount=50_000
+    )
+    assert return_values[0] == approx(50_000 / 120)
+
+
+def test_investment_functions_unwrap_0d_inputs_to_float():
+    monthly_value = monthly_amount_to_investment(
+        avg_ror=np.float64(0.07), years=np.int64(25), desired_amount=np.int64(1_000_000)
+    )
+    adjusted_value = investment_inflation_adjustment(
+        avg_inflation=np.float64(0.03),
+        years=np.int64(25),
+        desired_amount=np.int64(1_000_000),
+    )
+    assert isinstance(monthly_value, float)
+    assert monthly_value == approx(1277.07)
+    assert isinstance(adjusted_value, float)
+    assert adjusted_value == approx(477605.57)
+
+
+def test_investment_inflation_adjustment_broadcasts_array_inputs(
+    params_3pcinf_25yrs_million,
+):
+    return_values = investment_inflation_adjustment(
+        avg_inflation=np.array([0.0, params_3pcinf_25yrs_million.inflation_rate]),
+        years=params_3pcinf_25yrs_million.years,
+        desired_amount=params_3pcinf_25yrs_million.target,
+    )
+    assert isinstance(return_values, np.ndarray)
+    assert return_values.shape == (2,)
+    # A zero inflation rate leaves the target unadjusted
+    assert return_values[0] == approx(1_000_000)
+    assert return_values[1] == approx(477605.57)
+
+
+def test_negative_array_element_rejected():
+    with pytest.raises(RuntimeError):
+        monthly_amount_to_investment(
+            avg_ror=np.array([0.05, -0.05]), years=25, desired_amount=1_000_000
+        )
+    with pytest.raises(RuntimeError):
+        investment_inflation_adjustment(
+            avg_inflation=0.03, years=25, desired_amount=np.array([1_000_000, -1])
+        )
+
+
 @pytest.mark.parametrize(
     "test_negative_rate, test_negative_years, test_negative_target",
     [(-0.05, -10, -1000), (0.05, -10, -1000), (0.05, 10, -1000)],